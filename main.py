@@ -1,3 +1,8 @@
+import logging
+import queue
+from contextlib import asynccontextmanager
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 import uvicorn
@@ -6,13 +11,17 @@ from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from pydantic import EmailStr, BaseModel
 import uvicorn
 from starlette.middleware.cors import CORSMiddleware
-from src.routes import notes, tags, auth
+from src.routes import notes, auth
 import os
 
 import redis.asyncio as redis
 from fastapi import FastAPI
 from fastapi_limiter import FastAPILimiter
 from src.conf.config import settings
+from src.services.cache import cache
+from src.schemas import NoteResponse, TagResponse
+from src.database.db import sessionmanager
+from src.repository.notes import notes_batcher
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -20,28 +29,51 @@ from fastapi.middleware.cors import CORSMiddleware
 
 api_key = os.environ.get('API_KEY')
 
+# Handlers that write to stdout/files run on the listener thread, so logging never blocks the event loop.
+log_queue = queue.SimpleQueue()
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+log_listener = QueueListener(log_queue, log_handler, respect_handler_level=True)
 
+# Rate-limit checks borrow from this bounded pool instead of opening sockets per request.
+LIMITER_MAX_CONNECTIONS = 50
 
-app = FastAPI()
-app.include_router(auth.router, prefix='/api')
-app.include_router(tags.router, prefix='/api')
-app.include_router(notes.router, prefix='/api')
 
 
-
-@app.on_event("startup")
-async def startup():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """
-    The startup function is called when the server starts up.
-    It's a good place to initialize things that are needed by your application,
-    such as database connections or background tasks.
+    The lifespan function runs around the lifetime of the server.
+    Before the yield it initializes things that are needed by the application,
+    such as logging, the rate limiter, the cache connection pool and the notes batcher;
+    after the yield it releases them again.
     
-    :return: A coroutine, so we need to use the await keyword
+    :param app: FastAPI: The application being served
+    :return: An async generator used as the application lifespan
     :doc-author: Trelent
     """
-    r = await redis.Redis(host=settings.redis_host, port=settings.redis_port, db=0, encoding="utf-8",
-                          decode_responses=True)
-    await FastAPILimiter.init(r)
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    log_listener.start()
+    limiter_pool = redis.ConnectionPool(host=settings.redis_host, port=settings.redis_port, db=0,
+                                        encoding="utf-8", decode_responses=True,
+                                        max_connections=LIMITER_MAX_CONNECTIONS)
+    limiter_redis = redis.Redis(connection_pool=limiter_pool)
+    await FastAPILimiter.init(limiter_redis)
+    await cache.connect(settings.redis_host, settings.redis_port)
+    # Run the response schemas once so the first real request does not pay their warm-up cost.
+    tag = TagResponse(id=0, name="")
+    NoteResponse(id=0, title="", description="", created_at=datetime.now(), tags=[tag]).model_dump(mode="json")
+    notes_batcher.start(sessionmanager.session)
+    yield
+    await notes_batcher.stop()
+    await cache.disconnect()
+    await limiter_redis.close(close_connection_pool=True)
+    log_listener.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(auth.router, prefix='/api')
+app.include_router(notes.router, prefix='/api')
 
 
 
@@ -55,15 +87,6 @@ def read_root():
     :doc-author: Trelent
     """
     return {"message": "Hello World"}
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.include_router(auth.router)
 
 
 
@@ -86,9 +109,6 @@ conf = ConnectionConfig(
     TEMPLATE_FOLDER=Path(__file__).parent / 'templates',
 )
 
-app = FastAPI()
-
-
 @app.post("/send-email")
 async def send_in_background(background_tasks: BackgroundTasks, body: EmailSchema):
     """
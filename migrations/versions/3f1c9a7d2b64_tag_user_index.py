@@ -0,0 +1,45 @@
+"""Lead unique_tag_user with user_id
+
+Revision ID: 3f1c9a7d2b64
+Revises: 88376a5f4f2c
+Create Date: 2026-10-15 10:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b64'
+down_revision: Union[str, None] = '88376a5f4f2c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# No revision creates the tags table: it comes from a schema built outside Alembic.
+# On a database built from migrations alone there is nothing to change, so both steps are skipped.
+def _tags_unique_constraints() -> set | None:
+    inspector = sa.inspect(op.get_bind())
+    if 'tags' not in inspector.get_table_names():
+        return None
+    return {constraint['name'] for constraint in inspector.get_unique_constraints('tags')}
+
+
+def upgrade() -> None:
+    constraints = _tags_unique_constraints()
+    if constraints is None:
+        return
+    if 'unique_tag_user' in constraints:
+        op.drop_constraint('unique_tag_user', 'tags', type_='unique')
+    op.create_unique_constraint('unique_tag_user', 'tags', ['user_id', 'name'])
+
+
+def downgrade() -> None:
+    constraints = _tags_unique_constraints()
+    if constraints is None:
+        return
+    if 'unique_tag_user' in constraints:
+        op.drop_constraint('unique_tag_user', 'tags', type_='unique')
+    op.create_unique_constraint('unique_tag_user', 'tags', ['name', 'user_id'])
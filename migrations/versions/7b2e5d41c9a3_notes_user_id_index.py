@@ -0,0 +1,40 @@
+"""Index notes on (user_id, id)
+
+Revision ID: 7b2e5d41c9a3
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-15 14:03:27.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e5d41c9a3'
+down_revision: Union[str, None] = '3f1c9a7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Like tags, the notes table comes from a schema built outside Alembic; skip when it is absent.
+def _notes_indexes() -> set | None:
+    inspector = sa.inspect(op.get_bind())
+    if 'notes' not in inspector.get_table_names():
+        return None
+    return {index['name'] for index in inspector.get_indexes('notes')}
+
+
+def upgrade() -> None:
+    indexes = _notes_indexes()
+    if indexes is None or 'ix_notes_user_id_id' in indexes:
+        return
+    op.create_index('ix_notes_user_id_id', 'notes', ['user_id', 'id'])
+
+
+def downgrade() -> None:
+    indexes = _notes_indexes()
+    if indexes is None or 'ix_notes_user_id_id' not in indexes:
+        return
+    op.drop_index('ix_notes_user_id_id', table_name='notes')
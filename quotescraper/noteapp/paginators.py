@@ -0,0 +1,52 @@
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+
+class PKPaginator(Paginator):
+    """
+    Paginator that applies LIMIT/OFFSET to the primary keys only and then loads
+    the full rows with ``pk__in``. On deep pages the database skips over the
+    narrow primary key index instead of reading and discarding wide rows.
+    The object list must be an ordered QuerySet.
+
+    When ``count_cache_key`` is given, the total number of objects is kept in the
+    cache for ``count_timeout`` seconds so that the COUNT(*) query does not run on
+    every page view. Whoever changes the underlying table must delete that key.
+    """
+
+    def __init__(self, object_list, per_page, count_cache_key=None, count_timeout=60, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_cache_key = count_cache_key
+        self.count_timeout = count_timeout
+
+    @cached_property
+    def count(self):
+        """
+        The count function returns the total number of objects, read from the cache when possible.
+
+        :return: The number of objects across all pages
+        """
+        if self.count_cache_key is None:
+            return super().count
+        count = cache.get(self.count_cache_key)
+        if count is None:
+            count = self.object_list.count()
+            cache.set(self.count_cache_key, count, self.count_timeout)
+        return count
+
+    def page(self, number):
+        """
+        The page function returns a Page object for the given 1-based page number.
+
+        :param number: The page number to return
+        :return: A Page object holding the quotes of that page
+        """
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        page_pks = self.object_list.values('pk')[bottom:top]
+        object_list = self.object_list.filter(pk__in=page_pks)
+        return self._get_page(object_list, number, self)
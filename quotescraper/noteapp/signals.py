@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from .models import Tag, Quote
+from .views import POPULAR_TAGS_CACHE_KEY, POPULAR_TAGS_FRAGMENT, QUOTE_COUNT_CACHE_KEY
+
+
+@receiver(post_save, sender=Quote)
+@receiver(post_delete, sender=Quote)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(m2m_changed, sender=Quote.tags.through)
+def invalidate_popular_tags(sender, **kwargs):
+    """
+    The invalidate_popular_tags function drops the cached list of popular tags and the
+    rendered sidebar fragment whenever a quote or a tag is saved or deleted,
+    so the sidebar never shows stale counts.
+
+    :param sender: The model class that sent the signal
+    :param **kwargs: Signal arguments, not used
+    :return: Nothing
+    """
+    cache.delete_many([POPULAR_TAGS_CACHE_KEY, make_template_fragment_key(POPULAR_TAGS_FRAGMENT)])
+
+
+@receiver(post_save, sender=Quote)
+@receiver(post_delete, sender=Quote)
+def invalidate_quote_count(sender, **kwargs):
+    """
+    The invalidate_quote_count function drops the cached number of quotes used by the
+    paginator on the main page whenever a quote is added or removed.
+
+    :param sender: The model class that sent the signal
+    :param **kwargs: Signal arguments, not used
+    :return: Nothing
+    """
+    cache.delete(QUOTE_COUNT_CACHE_KEY)
@@ -11,4 +11,5 @@ urlpatterns = [
     path('add_author/', views.add_author, name='add_author'),
     path('add_quote/', views.add_quote, name='add_quote'),
     path('tag/<str:tag_name>/', views.selected_tag, name='selected_tag'),
+    path('tag/<str:tag_name>/<int:page>', views.selected_tag, name='selected_tag_paginate'),
 ]
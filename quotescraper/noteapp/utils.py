@@ -1,14 +1,22 @@
+import atexit
+import os
+
 from pymongo import MongoClient
 
 
+MONGODB_URL = os.environ.get('MONGODB_URL', 'mongodb://localhost')
+
+# MongoClient keeps its own connection pool, so one instance is shared by the whole process.
+_client = MongoClient(MONGODB_URL, maxPoolSize=50, connect=False)
+atexit.register(_client.close)
+
+
 def get_mongodb():
     """
-    The get_mongodb function connects to the MongoDB database and returns a reference to it.
+    The get_mongodb function returns a reference to the quotescraper database
+    on the shared MongoDB client.
     
     :return: The database object
     :doc-author: Trelent
     """
-    client = MongoClient('mongodb://localhost')
-
-    db = client.quotescraper
-    return db
+    return _client.quotescraper
@@ -1,15 +1,35 @@
-from django.shortcuts import render, redirect
+from django.shortcuts import render, redirect, get_object_or_404
+from django.core.cache import cache
 from django.core.paginator import Paginator
 from django.db.models import Count
 from django.contrib.auth.decorators import login_required
 
+from .paginators import PKPaginator
 from .utils import get_mongodb
 from .models import Tag, Author, Quote
 from .forms import RegisterAuthor, RegisterQuote, RegisterTag
 
 
-popular_tags = Tag.objects.annotate(num_quotes=Count('quote')).order_by('-num_quotes')[:10]
-popular_tags = [(tag, 2.75 * tag.num_quotes) for tag in popular_tags]
+POPULAR_TAGS_CACHE_KEY = 'popular_tags_v1'
+POPULAR_TAGS_TIMEOUT = 300
+POPULAR_TAGS_FRAGMENT = 'popular_tags_sidebar'
+QUOTE_COUNT_CACHE_KEY = 'quote_count'
+
+
+def get_popular_tags():
+    """
+    The get_popular_tags function returns the ten most used tags together with the font size
+    they are rendered with in the sidebar. The result is kept in the cache for POPULAR_TAGS_TIMEOUT
+    seconds and is dropped as soon as a quote or a tag changes (see signals.py).
+
+    :return: A list of (tag, size) tuples
+    """
+    return cache.get_or_set(
+        POPULAR_TAGS_CACHE_KEY,
+        lambda: [(tag, 2.75 * tag.num_quotes)
+                 for tag in Tag.objects.annotate(num_quotes=Count('quote')).order_by('-num_quotes')[:10]],
+        POPULAR_TAGS_TIMEOUT,
+    )
 
 
 def main(request, page=1):
@@ -26,13 +46,14 @@ def main(request, page=1):
     context = {}
     # db = get_mongodb()
     # quotes = db.quotes.find()
-    quotes = Quote.objects.all()
+    quotes = Quote.objects.all().select_related('author').prefetch_related('tags')
 
     per_page = 10
-    paginator = Paginator(list(quotes), per_page)
+    paginator = PKPaginator(quotes.order_by('pk'), per_page, count_cache_key=QUOTE_COUNT_CACHE_KEY)
     quotes_on_page = paginator.page(page)
 
-    context['popular_tags'] = popular_tags
+    # Passed uncalled: the template only evaluates it when the cached sidebar fragment has expired.
+    context['popular_tags'] = get_popular_tags
     context['quotes'] = quotes_on_page
     return render(request, 'quotes/index.html', context=context)
 
@@ -48,7 +69,7 @@ def author_detail(request, author_id):
     :return: The author
     :doc-author: Trelent
     """
-    author = Author.objects.get(pk=author_id)
+    author = get_object_or_404(Author, pk=author_id)
     return render(request, 'quotes/author.html', context={'author': author})
 
 
@@ -66,11 +87,16 @@ def selected_tag(request, tag_name, page=1):
     :doc-author: Trelent
     """
     tag = Tag.objects.get(name=tag_name)
-    quotes = Quote.objects.filter(tags=tag)
+    quotes = Quote.objects.filter(tags=tag).select_related('author').prefetch_related('tags').order_by('-id')
+
+    per_page = 10
+    paginator = Paginator(quotes, per_page)
+    quotes_on_page = paginator.page(page)
+
     context = {
         'tag': tag,
-        'quotes': quotes,
-        'popular_tags': popular_tags,
+        'quotes': quotes_on_page,
+        'popular_tags': get_popular_tags,
     }
     return render(request, 'quotes/tags.html', context=context)
 
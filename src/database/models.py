@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, func, Table, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, func, Table, UniqueConstraint, Index, inspect
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.schema import ForeignKey
 from sqlalchemy.sql.sqltypes import DateTime
@@ -17,12 +17,17 @@ note_m2m_tag = Table(
 
 class Note(Base):
     __tablename__ = "notes"
+    __table_args__ = (
+        # Serves the per-user pages of notes ordered by id without a sort.
+        Index('ix_notes_user_id_id', 'user_id', 'id'),
+    )
     id = Column(Integer, primary_key=True)
     title = Column(String(50), nullable=False)
     created_at = Column('created_at', DateTime, default=func.now())
     description = Column(String(150), nullable=False)
     done = Column(Boolean, default=False)
-    tags = relationship("Tag", secondary=note_m2m_tag, backref="notes")
+    # Must be eager loaded (selectinload) in queries; a lazy load would be one query per note.
+    tags = relationship("Tag", secondary=note_m2m_tag, backref="notes", lazy="raise")
     user_id = Column('user_id', ForeignKey('users.id', ondelete='CASCADE'), default=None)
     user = relationship('User', backref="notes")
 
@@ -30,7 +35,8 @@ class Note(Base):
 class Tag(Base):
     __tablename__ = "tags"
     __table_args__ = (
-        UniqueConstraint('name', 'user_id', name='unique_tag_user'),
+        # user_id leads so the same index serves every "tags of this user" lookup.
+        UniqueConstraint('user_id', 'name', name='unique_tag_user'),
     )
     id = Column(Integer, primary_key=True)
     name = Column(String(25), nullable=False)
@@ -47,4 +53,15 @@ class User(Base):
     created_at = Column('crated_at', DateTime, default=func.now())
     avatar = Column(String(255), nullable=True)
     refresh_token = Column(String(255), nullable=True)
-    confirmed = Column(Boolean, default=False)
\ No newline at end of file
+    confirmed = Column(Boolean, default=False)
+
+    def as_dict(self, exclude: tuple = ("password", "refresh_token")) -> dict:
+        """
+        The as_dict function returns the column values of the user keyed by attribute name,
+        leaving out credentials by default so the result is safe to cache.
+
+        :param exclude: tuple: Attribute names to leave out
+        :return: A dictionary of column values
+        """
+        return {attr.key: getattr(self, attr.key)
+                for attr in inspect(self).mapper.column_attrs if attr.key not in exclude}
@@ -1,13 +1,157 @@
-from typing import List
+import asyncio
+import contextlib
+from typing import Callable, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.database.models import Note, Tag, User
 from src.schemas import NoteModel, NoteUpdate, NoteStatusUpdate
 
 
-async def get_notes(skip: int, limit: int, user: User, db: Session) -> List[Note]:
+def _notes_page(user_id: int, skip: int, limit: int):
+    return (select(Note).where(Note.user_id == user_id).options(selectinload(Note.tags))
+            .order_by(Note.id).offset(skip).limit(limit))
+
+
+class NotesReadBatcher:
+    """
+    Coalesces concurrent note list reads into one query per batch window.
+    Callers await a future; a background task drains the queue, loads the pages of every
+    waiting user with a single LATERAL join over the (user_id, id) index and resolves each
+    future with its own page. A read for a single user uses the plain paged query instead.
+    The batch runs in its own session, so it only ever sees committed notes.
+    Each batch query runs in its own task, so a slow query does not hold up the next batches;
+    at most max_concurrency of them are in flight at once.
+    """
+
+    def __init__(self, window: float = 0.002, max_concurrency: int = 10):
+        self.window = window
+        self.max_concurrency = max_concurrency
+        self._session_factory: Optional[Callable] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loads: set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self, session_factory: Callable):
+        """
+        The start function spawns the background task that serves the queued reads.
+
+        :param self: Represent the instance of the class
+        :param session_factory: Callable: Returns an async context manager yielding an AsyncSession
+        :return: None
+        """
+        self._session_factory = session_factory
+        self._queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        The stop function cancels the background task, the batch queries in flight
+        and any reads still waiting for them.
+
+        :param self: Represent the instance of the class
+        :return: None
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        for load in self._loads:
+            load.cancel()
+        await asyncio.gather(*self._loads, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        self._task = None
+        self._queue = None
+
+    async def get(self, user_id: int, skip: int, limit: int) -> List[Note]:
+        """
+        The get function queues a read and waits for the batch that serves it.
+
+        :param self: Represent the instance of the class
+        :param user_id: int: The owner of the notes
+        :param skip: int: The number of notes to skip
+        :param limit: int: The maximum number of notes to return
+        :return: A list of notes
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(((user_id, skip, limit), future))
+        return await future
+
+    async def _run(self):
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                # A lone read goes out at once; the window only applies when others are already waiting.
+                if not self._queue.empty():
+                    await asyncio.sleep(self.window)
+                while not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                groups: Dict[Tuple[int, int], Dict[int, List[asyncio.Future]]] = {}
+                for (user_id, skip, limit), future in batch:
+                    groups.setdefault((skip, limit), {}).setdefault(user_id, []).append(future)
+                for (skip, limit), waiters in groups.items():
+                    load = asyncio.create_task(self._serve(skip, limit, waiters))
+                    self._loads.add(load)
+                    load.add_done_callback(self._loads.discard)
+                batch = []
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+
+    async def _serve(self, skip: int, limit: int, waiters: Dict[int, List[asyncio.Future]]):
+        futures = [future for user_futures in waiters.values() for future in user_futures]
+        try:
+            async with self._semaphore:
+                pages = await self._load(list(waiters), skip, limit)
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for user_id, user_futures in waiters.items():
+            for future in user_futures:
+                if not future.done():
+                    future.set_result(pages.get(user_id, []))
+
+    async def _load(self, user_ids: List[int], skip: int, limit: int) -> Dict[int, List[Note]]:
+        if len(user_ids) == 1:
+            stmt = _notes_page(user_ids[0], skip, limit)
+        else:
+            owners = select(User.id.label("user_id")).where(User.id.in_(user_ids)).subquery("owners")
+            page = (select(Note.id).where(Note.user_id == owners.c.user_id).order_by(Note.id)
+                    .offset(skip).limit(limit).correlate(owners).lateral("page"))
+            stmt = (select(Note).select_from(owners).join(page, true()).join(Note, Note.id == page.c.id)
+                    .options(selectinload(Note.tags)).order_by(Note.user_id, Note.id))
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            notes = result.scalars().all()
+        pages: Dict[int, List[Note]] = {}
+        for note in notes:
+            pages.setdefault(note.user_id, []).append(note)
+        return pages
+
+
+notes_batcher = NotesReadBatcher()
+
+
+async def get_notes(skip: int, limit: int, user: User, db: AsyncSession) -> List[Note]:
     """
     Retrieves a list of notes for a specific user with specified pagination parameters.
 
@@ -17,15 +161,19 @@ async def get_notes(skip: int, limit: int, user: User, db: Session) -> List[Note
     :type limit: int
     :param user: The user to retrieve notes for.
     :type user: User
-    :param db: The database session.
-    :type db: Session
+    :param db: The database session. Unused while the notes batcher is running: the batcher reads
+        through its own sessions from the factory it was started with.
+    :type db: AsyncSession
     :return: A list of notes.
     :rtype: List[Note]
     """
-    return db.query(Note).filter(Note.user_id == user.id).offset(skip).limit(limit).all()
+    if notes_batcher.running:
+        return await notes_batcher.get(user.id, skip, limit)
+    result = await db.execute(_notes_page(user.id, skip, limit))
+    return result.scalars().all()
 
 
-async def get_note(note_id: int, user: User, db: Session) -> Note:
+async def get_note(note_id: int, user: User, db: AsyncSession) -> Note:
     """
     Retrieves a single note with the specified ID for a specific user.
 
@@ -34,14 +182,16 @@ async def get_note(note_id: int, user: User, db: Session) -> Note:
     :param user: The user to retrieve the note for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The note with the specified ID, or None if it does not exist.
     :rtype: Note | None
     """
-    return db.query(Note).filter(and_(Note.id == note_id, Note.user_id == user.id)).first()
+    stmt = select(Note).where(and_(Note.id == note_id, Note.user_id == user.id)).options(selectinload(Note.tags))
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
 
 
-async def create_note(body: NoteModel, user: User, db: Session) -> Note:
+async def create_note(body: NoteModel, user: User, db: AsyncSession) -> Note:
     """
     Creates a new note for a specific user.
 
@@ -50,19 +200,21 @@ async def create_note(body: NoteModel, user: User, db: Session) -> Note:
     :param user: The user to create the note for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The newly created note.
     :rtype: Note
     """
-    tags = db.query(Tag).filter(and_(Tag.id.in_(body.tags), Tag.user_id == user.id)).all()
-    note = Note(title=body.title, description=body.description, tags=tags, user=user)
+    result = await db.execute(select(Tag).where(and_(Tag.id.in_(body.tags), Tag.user_id == user.id)))
+    tags = result.scalars().all()
+    note = Note(title=body.title, description=body.description, tags=tags, user_id=user.id)
     db.add(note)
-    db.commit()
-    db.refresh(note)
+    await db.flush()
+    await db.refresh(note, ["created_at"])
+    await db.commit()
     return note
 
 
-async def remove_note(note_id: int, user: User, db: Session) -> Note | None:
+async def remove_note(note_id: int, user: User, db: AsyncSession) -> Note | None:
     """
     Removes a single note with the specified ID for a specific user.
 
@@ -71,18 +223,18 @@ async def remove_note(note_id: int, user: User, db: Session) -> Note | None:
     :param user: The user to remove the note for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The removed note, or None if it does not exist.
     :rtype: Note | None
     """
-    note = db.query(Note).filter(and_(Note.id == note_id, Note.user_id == user.id)).first()
+    note = await get_note(note_id, user, db)
     if note:
-        db.delete(note)
-        db.commit()
+        await db.delete(note)
+        await db.commit()
     return note
 
 
-async def update_note(note_id: int, body: NoteUpdate, user: User, db: Session) -> Note | None:
+async def update_note(note_id: int, body: NoteUpdate, user: User, db: AsyncSession) -> Note | None:
     """
     Updates a single note with the specified ID for a specific user.
 
@@ -93,22 +245,22 @@ async def update_note(note_id: int, body: NoteUpdate, user: User, db: Session) -
     :param user: The user to update the note for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The updated note, or None if it does not exist.
     :rtype: Note | None
     """
-    note = db.query(Note).filter(and_(Note.id == note_id, Note.user_id == user.id)).first()
+    note = await get_note(note_id, user, db)
     if note:
-        tags = db.query(Tag).filter(and_(Tag.id.in_(body.tags), Note.user_id == user.id)).all()
+        result = await db.execute(select(Tag).where(and_(Tag.id.in_(body.tags), Tag.user_id == user.id)))
         note.title = body.title
         note.description = body.description
         note.done = body.done
-        note.tags = tags
-        db.commit()
+        note.tags = result.scalars().all()
+        await db.commit()
     return note
 
 
-async def update_status_note(note_id: int, body: NoteStatusUpdate, user: User, db: Session) -> Note | None:
+async def update_status_note(note_id: int, body: NoteStatusUpdate, user: User, db: AsyncSession) -> Note | None:
     """
     Updates the status (i.e. "done" or "not done") of a single note with the specified ID for a specific user.
 
@@ -119,12 +271,12 @@ async def update_status_note(note_id: int, body: NoteStatusUpdate, user: User, d
     :param user: The user to update the note for.
     :type user: User
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The updated note, or None if it does not exist.
     :rtype: Note | None
     """
-    note = db.query(Note).filter(and_(Note.id == note_id, Note.user_id == user.id)).first()
+    note = await get_note(note_id, user, db)
     if note:
         note.done = body.done
-        db.commit()
-    return note
\ No newline at end of file
+        await db.commit()
+    return note
@@ -1,27 +1,28 @@
 from typing import List
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Tag, User
 from src.schemas import TagModel
 
 
-async def get_tags(skip: int, limit: int, user: User, db: Session) -> List[Tag]:
+async def get_tags(skip: int, limit: int, user: User, db: AsyncSession) -> List[Tag]:
     """
     The get_tags function returns a list of tags for the given user.
     
     :param skip: int: Skip the first n tags
     :param limit: int: Limit the number of tags returned
     :param user: User: Get the user id from the database
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: A list of tags, which is the same as what we defined in our schema
     :doc-author: Trelent
     """
-    return db.query(Tag).filter(Tag.user_id == user.id).offset(skip).limit(limit).all()
+    result = await db.execute(select(Tag).where(Tag.user_id == user.id).offset(skip).limit(limit))
+    return result.scalars().all()
 
 
-async def get_tag(tag_id: int, user: User, db: Session) -> Tag:
+async def get_tag(tag_id: int, user: User, db: AsyncSession) -> Tag:
     """
     The get_tag function takes in a tag_id, user, and db.
     It returns the first Tag object that matches the given tag_id and user.
@@ -29,32 +30,34 @@ async def get_tag(tag_id: int, user: User, db: Session) -> Tag:
     
     :param tag_id: int: Specify the id of the tag to be retrieved
     :param user: User: Get the user that is currently logged in
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: A tag object
     :doc-author: Trelent
     """
-    return db.query(Tag).filter(and_(Tag.id == tag_id, Tag.user_id == user.id)).first()
+    result = await db.execute(select(Tag).where(and_(Tag.id == tag_id, Tag.user_id == user.id)))
+    return result.scalar_one_or_none()
 
 
-async def create_tag(body: TagModel, user: User, db: Session) -> Tag:
+async def create_tag(body: TagModel, user: User, db: AsyncSession) -> Tag:
     """
     The create_tag function creates a new tag in the database.
     
     :param body: TagModel: Get the name of the tag from the request body
     :param user: User: Get the user id of the current logged in user
-    :param db: Session: Access the database
+    :param db: AsyncSession: Access the database
     :return: A tag object, which is a database model
     :doc-author: Trelent
     """
     tag = Tag(name=body.name, user_id=user.id)
     db.add(tag)
-    db.commit()
-    db.refresh(tag)
+    await db.flush()
+    await db.refresh(tag)
+    await db.commit()
     return tag
 
 
 async def update_tag(
-    tag_id: int, body: TagModel, user: User, db: Session
+    tag_id: int, body: TagModel, user: User, db: AsyncSession
 ) -> Tag | None:
     """
     The update_tag function updates a tag in the database.
@@ -62,29 +65,36 @@ async def update_tag(
     :param tag_id: int: Identify the tag to be deleted
     :param body: TagModel: Define the type of data that is expected to be passed in
     :param user: User: Ensure that the user is authorized to delete a tag
-    :param db: Session: Access the database
+    :param db: AsyncSession: Access the database
     :return: The updated tag
     :doc-author: Trelent
     """
-    tag = db.query(Tag).filter(and_(Tag.id == tag_id, Tag.user_id == user.id)).first()
-    if tag:
-        tag.name = body.name
-        db.commit()
+    result = await db.execute(
+        update(Tag)
+        .where(and_(Tag.id == tag_id, Tag.user_id == user.id))
+        .values(name=body.name)
+        .returning(Tag)
+    )
+    tag = result.scalar_one_or_none()
+    await db.commit()
     return tag
 
 
-async def remove_tag(tag_id: int, user: User, db: Session) -> Tag | None:
+async def remove_tag(tag_id: int, user: User, db: AsyncSession) -> Tag | None:
     """
     The remove_tag function removes a tag from the database.
     
     :param tag_id: int: Specify the id of the tag that is to be removed
     :param user: User: Get the user's id from the database
-    :param db: Session: Pass in the database session
+    :param db: AsyncSession: Pass in the database session
     :return: The tag that was removed, or none if the tag did not exist
     :doc-author: Trelent
     """
-    tag = db.query(Tag).filter(and_(Tag.id == tag_id, Tag.user_id == user.id)).first()
-    if tag:
-        db.delete(tag)
-        db.commit()
-    return tag
\ No newline at end of file
+    result = await db.execute(
+        delete(Tag)
+        .where(and_(Tag.id == tag_id, Tag.user_id == user.id))
+        .returning(Tag)
+    )
+    tag = result.scalar_one_or_none()
+    await db.commit()
+    return tag
@@ -1,33 +1,116 @@
+import orjson
 from libgravatar import Gravatar
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from src.database.models import User
 from src.schemas import UserModel
+from src.services.cache import cache
 
 
-async def get_user_by_email(email: str, db: Session) -> User:
+USER_CACHE_TTL = 30
+
+
+async def get_user_by_email(email: str, db: AsyncSession) -> User:
     """
     The get_user_by_email function takes an email and a database session as arguments.
     It then queries the database for a user with that email address, returning the first result.
     If no such user exists, it returns None.
     
     :param email: str: Specify the email of a user
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: A user object
     :doc-author: Trelent
     """
-    return db.query(User).filter(User.email == email).first()
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalar_one_or_none()
+
+
+async def email_exists(email: str, db: AsyncSession) -> bool:
+    """
+    The email_exists function checks whether a user with the given email is registered,
+    without loading the user row.
+
+    :param email: str: Specify the email to look for
+    :param db: AsyncSession: Pass the database session to the function
+    :return: True if the email is taken, False otherwise
+    """
+    result = await db.execute(select(exists().where(User.email == email)))
+    return result.scalar()
+
+
+async def get_user_by_refresh_token(email: str, token: str, db: AsyncSession) -> User | None:
+    """
+    The get_user_by_refresh_token function returns the user with the given email
+    only if the given refresh token is the one currently stored for that user.
+
+    :param email: str: Specify the email of a user
+    :param token: str: The refresh token presented by the client
+    :param db: AsyncSession: Pass the database session to the function
+    :return: A user object, or None if the email or the token does not match
+    """
+    result = await db.execute(select(User).where(User.email == email, User.refresh_token == token))
+    return result.scalar_one_or_none()
+
+
+async def revoke_refresh_token(email: str, db: AsyncSession) -> None:
+    """
+    The revoke_refresh_token function clears the stored refresh token of the user with the given email
+    with a single UPDATE, without loading the user.
+
+    :param email: str: Specify the email of a user
+    :param db: AsyncSession: Pass the database session to the function
+    :return: None
+    """
+    await db.execute(update(User).where(User.email == email).values(refresh_token=None))
+    await db.commit()
+    await forget_cached_user(email)
+
+
+async def get_cached_user_by_email(email: str, db: AsyncSession) -> User | None:
+    """
+    The get_cached_user_by_email function works like get_user_by_email, but keeps the found user
+    in Redis for USER_CACHE_TTL seconds. It backs the authentication of every request.
+    Only a snapshot of the user's columns without credentials is cached, so a user from the cache
+    carries no password or refresh token; a cache hit returns a new detached user that is not tied to any session.
+
+    :param email: str: Specify the email of a user
+    :param db: AsyncSession: Pass the database session to the function
+    :return: A user object, or None if there is no user with that email
+    """
+    cached = await cache.get(f"user:{email}")
+    if cached is not None:
+        user = User(**orjson.loads(cached))
+        make_transient_to_detached(user)
+        return user
+    user = await get_user_by_email(email, db)
+    if user is not None:
+        snapshot = orjson.dumps(user.as_dict())
+        await cache.set(f"user:{email}", snapshot, expire=USER_CACHE_TTL)
+    return user
+
+
+async def forget_cached_user(email: str) -> None:
+    """
+    The forget_cached_user function drops the cached user with the given email.
+    It must be called after every committed change to the user record.
+
+    :param email: str: The email of the user to drop
+    :return: None
+    """
+    await cache.delete(f"user:{email}")
 
 
-async def create_user(body: UserModel, db: Session) -> User:
+async def create_user(body: UserModel, db: AsyncSession) -> User:
     """
-    The create_user function takes a UserModel and a Session object as arguments.
+    The create_user function takes a UserModel and an AsyncSession object as arguments.
     It then creates an avatar URL from the user's email address using Gravatar,
     and uses that to create a new User object. It adds the new user to the database,
     commits it, and returns it.
     
     :param body: UserModel: Get the data from the request body
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: A user object
     :doc-author: Trelent
     """
@@ -39,35 +122,39 @@ async def create_user(body: UserModel, db: Session) -> User:
         print(e)
     new_user = User(**body.model_dump(), avatar=avatar)
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.flush()
+    await db.refresh(new_user)
+    await db.commit()
     return new_user
 
 
-async def update_token(user: User, token: str | None, db: Session) -> None:
+async def update_token(user: User, token: str | None, db: AsyncSession) -> None:
     """
     The update_token function updates the refresh token for a user.
+    Only the refresh_token column is written, so a user that came from the cache
+    cannot overwrite newer values of its other columns.
     
     :param user: User: Specify the user object that is being updated
     :param token: str | None: Set the refresh token for the user
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: None
     :doc-author: Trelent
     """
-    user.refresh_token = token
-    db.commit()
+    await db.execute(update(User).where(User.id == user.id).values(refresh_token=token))
+    await db.commit()
 
-async def confirmed_email(email: str, db: Session) -> None:
+async def confirmed_email(email: str, db: AsyncSession) -> None:
     """
     The confirmed_email function takes an email and a database session as arguments.
     It then queries the database for the user with that email address, sets their confirmed field to True,
     and commits those changes to the database.
     
     :param email: str: Get the email of the user
-    :param db: Session: Pass in the database session
+    :param db: AsyncSession: Pass in the database session
     :return: Nothing
     :doc-author: Trelent
     """
     user = await get_user_by_email(email, db)
     user.confirmed = True
-    db.commit()
\ No newline at end of file
+    await db.commit()
+    await forget_cached_user(email)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List
 from fastapi import APIRouter, HTTPException, Depends, status, Security,BackgroundTasks, Request
 
@@ -6,7 +7,7 @@ from fastapi.security import (
     HTTPAuthorizationCredentials,
     HTTPBearer,
 )
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.schemas import UserModel, UserResponse, TokenModel
@@ -21,7 +22,7 @@ security = HTTPBearer()
 
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db)):
+async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Request, db: AsyncSession = Depends(get_db)):
     """
     The signup function creates a new user in the database.
         It takes a UserModel object as input, and returns an HTTP response with the newly created user's information.
@@ -30,14 +31,13 @@ async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Re
     :param body: UserModel: Get the user's email and password from the request body
     :param background_tasks: BackgroundTasks: Add a task to the background queue
     :param request: Request: Get the base_url of the application
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: A dictionary with two keys: user and detail
     :doc-author: Trelent
     """
-    exist_user = await repository_users.get_user_by_email(body.email, db)
-    if exist_user:
+    if await repository_users.email_exists(body.email, db):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Account already exists")
-    body.password = auth_service.get_password_hash(body.password)
+    body.password = await asyncio.to_thread(auth_service.get_password_hash, body.password)
     new_user = await repository_users.create_user(body, db)
     background_tasks.add_task(send_email, new_user.email, new_user.username, request.base_url)
     return {"user": new_user, "detail": "User successfully created. Check your email for confirmation."}
@@ -45,27 +45,30 @@ async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Re
 
 
 @router.post("/login", response_model=TokenModel)
-async def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(body: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
     """
     The login function is used to authenticate a user.
         It takes in the username and password of the user, and returns an access token if successful.
         The access token can be used to make authenticated requests.
     
     :param body: OAuth2PasswordRequestForm: Get the username and password from the request body
-    :param db: Session: Get the database session
+    :param db: AsyncSession: Get the database session
     :return: A jwt
     :doc-author: Trelent
     """
+    # Read from the database: the password hash is never cached.
     user = await repository_users.get_user_by_email(body.username, db)
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email")
     if not user.confirmed:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Email not confirmed")
-    if not auth_service.verify_password(body.password, user.password):
+    if not await asyncio.to_thread(auth_service.verify_password, body.password, user.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid password")
     
-    access_token = await auth_service.create_access_token(data={"sub": user.email})
-    refresh_token = await auth_service.create_refresh_token(data={"sub": user.email})
+    access_token, refresh_token = await asyncio.gather(
+        auth_service.create_access_token(data={"sub": user.email}),
+        auth_service.create_refresh_token(data={"sub": user.email}),
+    )
     await repository_users.update_token(user, refresh_token, db)
     return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
 
@@ -73,7 +76,7 @@ async def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depen
 @router.get("/refresh_token", response_model=TokenModel)
 async def refresh_token(
     credentials: HTTPAuthorizationCredentials = Security(security),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     The refresh_token function is used to refresh the access token.
@@ -81,22 +84,24 @@ async def refresh_token(
         If the refresh_token is invalid, it will return a 401 Unauthorized error.
     
     :param credentials: HTTPAuthorizationCredentials: Get the token from the authorization header
-    :param db: Session: Get the database session
+    :param db: AsyncSession: Get the database session
     :param : Get the user's email from the token
     :return: An object with the access_token, refresh_token and token type
     :doc-author: Trelent
     """
     token = credentials.credentials
     email = await auth_service.decode_refresh_token(token)
-    user = await repository_users.get_user_by_email(email, db)
-    if user.refresh_token != token:
-        await repository_users.update_token(user, None, db)
+    user = await repository_users.get_user_by_refresh_token(email, token, db)
+    if user is None:
+        await repository_users.revoke_refresh_token(email, db)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
         )
 
-    access_token = await auth_service.create_access_token(data={"email": email})
-    refresh_token = await auth_service.create_refresh_token(data={"email": email})
+    access_token, refresh_token = await asyncio.gather(
+        auth_service.create_access_token(data={"sub": email}),
+        auth_service.create_refresh_token(data={"sub": email}),
+    )
     await repository_users.update_token(user, refresh_token, db)
     return {
         "access_token": access_token,
@@ -106,7 +111,7 @@ async def refresh_token(
 
 
 @router.get('/confirmed_email/{token}')
-async def confirmed_email(token: str, db: Session = Depends(get_db)):
+async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)):
     """
     The confirmed_email function is used to confirm a user's email address.
         It takes the token from the URL and uses it to get the user's email address.
@@ -114,7 +119,7 @@ async def confirmed_email(token: str, db: Session = Depends(get_db)):
         If not, then we update their record in our database with a confirmation of their email.
     
     :param token: str: Get the token from the url
-    :param db: Session: Get the database session
+    :param db: AsyncSession: Get the database session
     :return: The message &quot;your email is already confirmed&quot; if the user's email is already
     :doc-author: Trelent
     """
@@ -130,7 +135,7 @@ async def confirmed_email(token: str, db: Session = Depends(get_db)):
 
 @router.post('/request_email')
 async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, request: Request,
-                        db: Session = Depends(get_db)):
+                        db: AsyncSession = Depends(get_db)):
     """
     The request_email function is used to request a confirmation email for the user's account.
         The function takes in an email address and sends a confirmation link to that address.
@@ -139,14 +144,15 @@ async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, r
     :param body: RequestEmail: Get the email from the request body
     :param background_tasks: BackgroundTasks: Add a task to the background tasks queue
     :param request: Request: Get the base_url of the application
-    :param db: Session: Get the database session
+    :param db: AsyncSession: Get the database session
     :return: A message to the user
     :doc-author: Trelent
     """
     user = await repository_users.get_user_by_email(body.email, db)
 
+    if user is None:
+        return {"message": "Check your email for confirmation."}
     if user.confirmed:
         return {"message": "Your email is already confirmed"}
-    if user:
-        background_tasks.add_task(send_email, user.email, user.username, request.base_url)
+    background_tasks.add_task(send_email, user.email, user.username, request.base_url)
     return {"message": "Check your email for confirmation."}
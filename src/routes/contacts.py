@@ -0,0 +1,129 @@
+from datetime import date, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src import crud
+from src.database.db import get_db
+from src.schemas import ContactCreate, Contact, ContactUpdate
+
+router = APIRouter(prefix="/contacts", tags=["contacts"])
+
+
+@router.post("/", response_model=Contact)
+async def create_contact(contact: ContactCreate, db: AsyncSession = Depends(get_db)):
+    """
+    The create_contact function creates a new contact in the database.
+        The function takes a ContactCreate object as an argument, and returns the newly created contact.
+    
+    
+    :param contact: ContactCreate: Pass the contact to be created
+    :param db: AsyncSession: Pass the database session to the function
+    :return: The created contact, and the response status code is 201 (created)
+    :doc-author: Trelent
+    """
+    return crud.create_contact(db, contact)
+    
+@router.get("/", response_model=list[Contact])
+async def get_contacts(skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=100),
+                       db: AsyncSession = Depends(get_db)):
+    """
+    The get_contacts function returns a list of contacts.
+    
+    :param skip: int: Skip the first n contacts in the database
+    :param limit: int: Limit the number of contacts returned
+    :param db: AsyncSession: Pass in the database session
+    :return: A list of contacts
+    :doc-author: Trelent
+    """
+    return crud.get_contacts(db, skip=skip, limit=limit)
+    
+
+@router.get("/{contact_id}", response_model=Contact)
+async def get_contact(contact_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    The get_contact function returns a contact with the given ID.
+    
+    :param contact_id: int: Specify the contact id that is passed in the url
+    :param db: AsyncSession: Pass the database connection to the function
+    :return: A contact object, which is defined in the models
+    :doc-author: Trelent
+    """
+    contact = crud.get_contact(db, contact_id)
+    if contact is None:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    return contact
+    
+
+@router.put("/{contact_id}", response_model=Contact)
+async def update_contact(contact_id: int, updated_contact: ContactUpdate, db: AsyncSession = Depends(get_db)):
+    """
+    The update_contact function updates a contact in the database.
+        It takes an id, and a ContactUpdate object as input.
+        The function returns the updated contact.
+    
+    :param contact_id: int: Identify the contact to be deleted
+    :param updated_contact: ContactUpdate: Specify the type of data that is expected to be passed in
+    :param db: AsyncSession: Pass the database session to the function
+    :return: A contact object
+    :doc-author: Trelent
+    """
+    contact = crud.update_contact(db, contact_id, updated_contact)
+    if contact is None:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    return contact
+    
+
+@router.delete("/{contact_id}", response_model=Contact)
+async def delete_contact(contact_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    The delete_contact function deletes a contact from the database.
+    
+    :param contact_id: int: Specify the contact to delete
+    :param db: AsyncSession: Pass the database session to the function
+    :return: The deleted contact
+    :doc-author: Trelent
+    """
+    contact = crud.delete_contact(db, contact_id)
+    if contact is None:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    return contact
+    
+
+
+
+
+@router.get("/search/", response_model=list[Contact])
+async def search_contacts(
+    query: str = Query(..., description="Search query for name, last name, or email"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    The search_contacts function searches for contacts in the database.
+    
+    :param query: str: Specify the search query
+    :param description: Provide a description for the parameter
+    :param last name: Filter the contacts by last name
+    :param or email&quot;): Describe the parameter in the api documentation
+    :param skip: int: Skip the first n matching contacts
+    :param limit: int: Limit the number of contacts returned, at most 100
+    :param db: AsyncSession: Get the database session
+    :return: A list of contacts
+    :doc-author: Trelent
+    """
+    return crud.search_contacts(db, query, skip=skip, limit=limit)
+    
+@router.get("/birthdays/", response_model=list[Contact])
+async def upcoming_birthdays(db: AsyncSession = Depends(get_db)):
+    """
+    The upcoming_birthdays function returns a list of contacts with birthdays in the next week.
+    
+    :param db: AsyncSession: Get the database session
+    :return: A list of dictionaries
+    :doc-author: Trelent
+    """
+    today = date.today()
+    next_week = today + timedelta(days=7)
+    return crud.get_upcoming_birthdays(db, today, next_week)
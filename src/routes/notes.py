@@ -1,107 +1,120 @@
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
-from src.database.db import get_db
-from src.database.models import User
 from src.schemas import NoteModel, NoteUpdate, NoteStatusUpdate, NoteResponse
 from src.repository import notes as repository_notes
-from src.services.auth import auth_service
+from src.services.auth import AuthedCtx, get_authed_ctx
+from src.services.cache import cache, forget_cached_notes, notes_cache_version
 from fastapi_limiter.depends import RateLimiter
     
-router = APIRouter(prefix="/notes", tags=["notes"])
+router = APIRouter(prefix="/notes", tags=["notes"], default_response_class=ORJSONResponse)
 
+NOTES_CACHE_EXPIRE = 30
 
-@router.get("/", response_model=List[NoteResponse])
-async def read_notes(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.get_current_user),
-):
+notes_list_limiter = RateLimiter(times=10, seconds=60)
+
+# Serializes note lists straight from ORM objects, bypassing FastAPI's response_model revalidation.
+notes_adapter = TypeAdapter(List[NoteResponse])
+
+
+@router.get("/", response_model=None, responses={200: {"model": List[NoteResponse]}},
+            description='No more than 10 requests per minute', dependencies=[Depends(notes_list_limiter)])
+async def read_notes(skip: int = 0, limit: int = 100, ctx: AuthedCtx = Depends(get_authed_ctx)):
     """
     The read_notes function returns a list of notes.
     
     :param skip: int: Skip the first n notes
-    :param limit: int: Limit the number of notes returned
-    :param db: Session: Pass the database session to the repository
-    :param current_user: User: Get the current user
-    :param : Get the note id from the url
-    :return: A list of notes
+    :param limit: int: Specify the maximum number of notes to return
+    :param ctx: AuthedCtx: Get the current user and the database session
+    :return: A JSON response with the list of notes
     :doc-author: Trelent
     """
-    notes = await repository_notes.get_notes(skip, limit, current_user, db)
-    return notes
+    version = await notes_cache_version(ctx.user.id)
+    key = f"notes:{ctx.user.id}:{version}:{skip}:{limit}"
+    cached = await cache.get(key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    notes = await repository_notes.get_notes(skip, limit, ctx.user, ctx.db)
+    content = notes_adapter.dump_json(notes_adapter.validate_python(notes, from_attributes=True))
+    await cache.set(key, content, expire=NOTES_CACHE_EXPIRE)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/{note_id}", response_model=NoteResponse)
 async def read_note(
     note_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.get_current_user),
+    ctx: AuthedCtx = Depends(get_authed_ctx),
 ):
     """
     The read_note function is a GET endpoint that returns the note with the given ID.
     If no such note exists, it raises an HTTP 404 error.
     
     :param note_id: int: Specify the note id
-    :param db: Session: Pass the database session to the function
-    :param current_user: User: Get the current user from the database
+    :param ctx: AuthedCtx: Get the current user and the database session
     :param : Get the note id from the url
     :return: A note object
     :doc-author: Trelent
     """
-    note = await repository_notes.get_note(note_id, current_user, db)
+    version = await notes_cache_version(ctx.user.id)
+    key = f"note:{ctx.user.id}:{version}:{note_id}"
+    cached = await cache.get(key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    note = await repository_notes.get_note(note_id, ctx.user, ctx.db)
     if note is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Note not found"
         )
+    payload = NoteResponse.model_validate(note).model_dump(mode="json")
+    await cache.set(key, orjson.dumps(payload), expire=NOTES_CACHE_EXPIRE)
     return note
 
 
 @router.post("/", response_model=NoteResponse, status_code=status.HTTP_201_CREATED)
 async def create_note(
     body: NoteModel,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.get_current_user),
+    ctx: AuthedCtx = Depends(get_authed_ctx),
 ):
     """
     The create_note function creates a new note.
     
     :param body: NoteModel: Specify the data that will be sent in the request body
-    :param db: Session: Get a database session
-    :param current_user: User: Get the current user from the database
+    :param ctx: AuthedCtx: Get the current user and the database session
     :param : Get the note id from the url
     :return: The created note
     :doc-author: Trelent
     """
-    return await repository_notes.create_note(body, current_user, db)
+    note = await repository_notes.create_note(body, ctx.user, ctx.db)
+    await forget_cached_notes(ctx.user.id)
+    return note
 
 
 @router.put("/{note_id}", response_model=NoteResponse)
 async def update_note(
     body: NoteUpdate,
     note_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.get_current_user),
+    ctx: AuthedCtx = Depends(get_authed_ctx),
 ):
     """
     The update_note function updates a note in the database.
     
     :param body: NoteUpdate: Get the data from the request body
     :param note_id: int: Identify the note to be deleted
-    :param db: Session: Pass the database session to the function
-    :param current_user: User: Get the current user from the database
+    :param ctx: AuthedCtx: Get the current user and the database session
     :param : Get the note id from the url
     :return: The updated note object
     :doc-author: Trelent
     """
-    note = await repository_notes.update_note(note_id, body, current_user, db)
+    note = await repository_notes.update_note(note_id, body, ctx.user, ctx.db)
     if note is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Note not found"
         )
+    await forget_cached_notes(ctx.user.id)
     return note
 
 
@@ -109,65 +122,45 @@ async def update_note(
 async def update_status_note(
     body: NoteStatusUpdate,
     note_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.get_current_user),
+    ctx: AuthedCtx = Depends(get_authed_ctx),
 ):
     """
     The update_status_note function updates the status of a note.
     
     :param body: NoteStatusUpdate: Get the status of the note
     :param note_id: int: Get the note id from the url
-    :param db: Session: Pass the database connection to the function
-    :param current_user: User: Get the user who is currently logged in
+    :param ctx: AuthedCtx: Get the current user and the database session
     :param : Get the note id
     :return: The updated note
     :doc-author: Trelent
     """
-    note = await repository_notes.update_status_note(note_id, body, current_user, db)
+    note = await repository_notes.update_status_note(note_id, body, ctx.user, ctx.db)
     if note is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Note not found"
         )
+    await forget_cached_notes(ctx.user.id)
     return note
 
 
 @router.delete("/{note_id}", response_model=NoteResponse)
 async def remove_note(
     note_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(auth_service.get_current_user),
+    ctx: AuthedCtx = Depends(get_authed_ctx),
 ):
     """
     The remove_note function removes a note from the database.
     
     :param note_id: int: Specify the note id
-    :param db: Session: Pass the database session to the function
-    :param current_user: User: Get the user that is currently logged in
+    :param ctx: AuthedCtx: Get the current user and the database session
     :param : Get the note_id from the url
     :return: A note, but it's not a noteinresponse object
     :doc-author: Trelent
     """
-    note = await repository_notes.remove_note(note_id, current_user, db)
+    note = await repository_notes.remove_note(note_id, ctx.user, ctx.db)
     if note is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Note not found"
         )
+    await forget_cached_notes(ctx.user.id)
     return note
-
-
-@router.get("/", response_model=List[NoteResponse], description='No more than 10 requests per minute',
-            dependencies=[Depends(RateLimiter(times=10, seconds=60))])
-async def read_notes(skip: int = 0, limit: int = 100, db: Session = Depends(get_db),
-                     current_user: User = Depends(auth_service.get_current_user)):
-    """
-    The read_notes function returns a list of notes.
-    
-    :param skip: int: Skip the first n notes
-    :param limit: int: Specify the maximum number of notes to return
-    :param db: Session: Get a database session
-    :param current_user: User: Get the current user
-    :return: A list of notes
-    :doc-author: Trelent
-    """
-    notes = await repository_notes.get_notes(skip, limit, current_user, db)
-    return notes
\ No newline at end of file
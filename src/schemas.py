@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 
 class TagModel(BaseModel):
@@ -10,8 +10,7 @@ class TagModel(BaseModel):
 class TagResponse(TagModel):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NoteBase(BaseModel):
@@ -37,8 +36,7 @@ class NoteResponse(NoteBase):
     created_at: datetime
     tags: List[TagResponse]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserModel(BaseModel):
@@ -54,8 +52,7 @@ class UserDb(BaseModel):
     created_at: datetime
     avatar: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserResponse(BaseModel):
@@ -1,29 +1,51 @@
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
 from typing import Optional
 
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
-from passlib.context import CryptContext
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+import bcrypt
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
+from src.database.models import User
 from src.repository import users as repository_users
 from src.conf.config import settings
 
 
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+
+# Encoded once so PyJWT does not re-encode the key on every sign/verify.
+SECRET_KEY = settings.secret_key.encode()
+ALGORITHM = settings.algorithm
+# RSA/ECDSA verification takes milliseconds, so those tokens are decoded off the event loop.
+ASYMMETRIC_ALGORITHM = ALGORITHM.startswith(("RS", "ES", "PS"))
+
+# Token lifetimes in seconds; JWT iat/exp claims are plain epoch seconds.
+DEFAULT_ACCESS_TTL = 150 * 60
+DEFAULT_REFRESH_TTL = 7 * 24 * 60 * 60
+EMAIL_TOKEN_TTL = 7 * 24 * 60 * 60
+
+TOKEN_CACHE_MAXSIZE = 4096
+# bcrypt only uses the first 72 bytes; newer bcrypt releases raise instead of truncating.
+BCRYPT_MAX_BYTES = 72
+
+# blake2b(token) -> decoded payload, so raw tokens are not kept in memory.
+_decoded_tokens: dict[bytes, dict] = {}
+
 
 class Auth:
      
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-    SECRET_KEY = settings.secret_key
-    ALGORITHM = settings.algorithm
-    oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+    BCRYPT_ROUNDS = settings.bcrypt_rounds
 
     def verify_password(self, plain_password, hashed_password):
         """
         The verify_password function takes a plain-text password and hashed
-        password as arguments. It then uses the CryptContext instance to verify that
+        password as arguments. It then uses bcrypt to verify that
         the plain-text password matches the hashed version. If it does, it returns True;
         otherwise, False.
         
@@ -33,19 +55,19 @@ class Auth:
         :return: True or false depending on whether the password is correct
         :doc-author: Trelent
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return bcrypt.checkpw(plain_password.encode()[:BCRYPT_MAX_BYTES], hashed_password.encode())
 
     def get_password_hash(self, password: str):
         """
-        The get_password_hash function takes a password and returns the hashed version of it.
-        The hashing algorithm is defined in the settings file, which is imported at the top of this file.
+        The get_password_hash function takes a password and returns the bcrypt hash of it.
+        The cost factor is defined by bcrypt_rounds in the settings file.
         
         :param self: Represent the instance of the class
         :param password: str: Pass in the password that is to be hashed
         :return: A hash of the password
         :doc-author: Trelent
         """
-        return self.pwd_context.hash(password)
+        return bcrypt.hashpw(password.encode()[:BCRYPT_MAX_BYTES], bcrypt.gensalt(rounds=self.BCRYPT_ROUNDS)).decode()
 
     # define a function to generate a new access token
     async def create_access_token(self, data: dict, expires_delta: Optional[float] = None):
@@ -62,12 +84,10 @@ class Auth:
         :doc-author: Trelent
         """
         to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.utcnow() + timedelta(seconds=expires_delta)
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=150)
-        to_encode.update({"iat": datetime.utcnow(), "exp": expire, "scope": "access_token"})
-        encoded_access_token = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
+        now = int(time.time())
+        expire = now + (int(expires_delta) if expires_delta else DEFAULT_ACCESS_TTL)
+        to_encode.update({"iat": now, "exp": expire, "scope": "access_token"})
+        encoded_access_token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         return encoded_access_token
   
     async def create_refresh_token(self, data: dict, expires_delta: Optional[float] = None):
@@ -84,12 +104,10 @@ class Auth:
         :doc-author: Trelent
         """
         to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.utcnow() + timedelta(seconds=expires_delta)
-        else:
-            expire = datetime.utcnow() + timedelta(days=7)
-        to_encode.update({"iat": datetime.utcnow(), "exp": expire, "scope": "refresh_token"})
-        encoded_refresh_token = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
+        now = int(time.time())
+        expire = now + (int(expires_delta) if expires_delta else DEFAULT_REFRESH_TTL)
+        to_encode.update({"iat": now, "exp": expire, "scope": "refresh_token"})
+        encoded_refresh_token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         return encoded_refresh_token
 
         
@@ -106,49 +124,14 @@ class Auth:
         """
         
         try:
-            payload = jwt.decode(refresh_token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
             if payload['scope'] == 'refresh_token':
                 email = payload['sub']
                 return email
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid scope for token')
-        except JWTError:
+        except PyJWTError:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Could not validate credentials')
  
-    async def get_current_user(self, token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-        """
-        The get_current_user function is a dependency that will be used in the protected routes.
-        It takes a token as an argument and returns the user object if it's valid, otherwise raises an exception.
-        
-        :param self: Access the class attributes
-        :param token: str: Get the token from the authorization header
-        :param db: Session: Get the database session from the dependency
-        :return: A user object if the token is valid
-        :doc-author: Trelent
-        """
-        credentials_exception = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-        try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
-            if payload['scope'] == 'access_token':
-                email = payload["sub"]
-                if email is None:
-                    raise credentials_exception
-            else:
-                raise credentials_exception
-        except JWTError as e:
-            raise credentials_exception
-        
-
-        user = await repository_users.get_user_by_email(email, db)
-        if user is None:
-            raise credentials_exception
-        return user
-
-    
     def create_email_token(self, data: dict):
         """
         The create_email_token function is used to create a token that will be sent to the user's email address.
@@ -161,9 +144,9 @@ class Auth:
         :doc-author: Trelent
         """
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(days=7)
-        to_encode.update({"iat": datetime.utcnow(), "exp": expire})
-        token = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
+        now = int(time.time())
+        to_encode.update({"iat": now, "exp": now + EMAIL_TOKEN_TTL})
+        token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         return token
 
 
@@ -179,14 +162,90 @@ class Auth:
         :doc-author: Trelent
         """
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
             email = payload["sub"]
             return email
-        except JWTError as e:
+        except PyJWTError as e:
             print(e)
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                                 detail="Invalid token for email verification")
 
 
 
-auth_service = Auth()
\ No newline at end of file
+auth_service = Auth()
+
+
+def decode_access_token(token: str) -> dict:
+    """
+    The decode_access_token function decodes a JWT and returns its payload.
+    Decoded payloads are cached under the blake2b digest of the token until the token expires,
+    so repeated requests with the same token skip the signature check.
+
+    :param token: str: The encoded token
+    :return: The payload of the token
+    :raises PyJWTError: If the token is invalid or expired
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=32).digest()
+    payload = _decoded_tokens.get(key)
+    if payload is not None and payload["exp"] > time.time():
+        return payload
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    if len(_decoded_tokens) >= TOKEN_CACHE_MAXSIZE:
+        _decoded_tokens.clear()
+    _decoded_tokens[key] = payload
+    return payload
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
+    """
+    The get_current_user function is a dependency that will be used in the protected routes.
+    It takes a token as an argument and returns the user object if it's valid, otherwise raises an exception.
+    
+    :param token: str: Get the token from the authorization header
+    :param db: AsyncSession: Get the database session from the dependency
+    :return: A user object if the token is valid
+    :doc-author: Trelent
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    try:
+        if ASYMMETRIC_ALGORITHM:
+            payload = await asyncio.to_thread(decode_access_token, token)
+        else:
+            payload = decode_access_token(token)
+        if payload['scope'] == 'access_token':
+            email = payload["sub"]
+            if email is None:
+                raise credentials_exception
+        else:
+            raise credentials_exception
+    except PyJWTError as e:
+        raise credentials_exception
+    
+
+    user = await repository_users.get_cached_user_by_email(email, db)
+    if user is None:
+        raise credentials_exception
+    return user
+
+
+@dataclass(frozen=True, slots=True)
+class AuthedCtx:
+    user: User
+    db: AsyncSession
+
+
+async def get_authed_ctx(db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)) -> AuthedCtx:
+    """
+    The get_authed_ctx function bundles the current user and the database session,
+    so a protected route needs a single dependency instead of two.
+
+    :param db: AsyncSession: Get the database session from the dependency
+    :param user: User: Get the current user from the dependency
+    :return: An AuthedCtx holding the user and the session
+    """
+    return AuthedCtx(user=user, db=db)
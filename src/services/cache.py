@@ -0,0 +1,134 @@
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache:
+    """
+    Thin async wrapper around a pooled Redis client used for cache-aside lookups.
+    Every method treats an unavailable Redis as a cache miss, so callers can always
+    fall back to the database.
+    """
+
+    def __init__(self):
+        self._redis: Optional[redis.Redis] = None
+
+    async def connect(self, host: str, port: int, max_connections: int = 20):
+        """
+        The connect function creates the connection pool shared by all requests.
+
+        :param self: Represent the instance of the class
+        :param host: str: Redis host
+        :param port: int: Redis port
+        :param max_connections: int: Upper bound of pooled connections
+        :return: None
+        """
+        pool = redis.ConnectionPool(host=host, port=port, db=0, max_connections=max_connections)
+        self._redis = redis.Redis(connection_pool=pool)
+
+    async def disconnect(self):
+        """
+        The disconnect function closes the client and its connection pool.
+
+        :param self: Represent the instance of the class
+        :return: None
+        """
+        if self._redis is not None:
+            await self._redis.close(close_connection_pool=True)
+            self._redis = None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        The get function returns the cached value for the key, or None on a miss.
+
+        :param self: Represent the instance of the class
+        :param key: str: Cache key
+        :return: The cached bytes or None
+        """
+        if self._redis is None:
+            return None
+        try:
+            return await self._redis.get(key)
+        except redis.RedisError:
+            logger.warning("Cache get failed for %s", key, exc_info=True)
+            return None
+
+    async def set(self, key: str, value: bytes, expire: int):
+        """
+        The set function stores the value under the key for expire seconds.
+
+        :param self: Represent the instance of the class
+        :param key: str: Cache key
+        :param value: bytes: Serialized value
+        :param expire: int: Time to live in seconds
+        :return: None
+        """
+        if self._redis is None:
+            return
+        try:
+            await self._redis.setex(key, expire, value)
+        except redis.RedisError:
+            logger.warning("Cache set failed for %s", key, exc_info=True)
+
+    async def delete(self, *keys: str):
+        """
+        The delete function removes the given keys.
+
+        :param self: Represent the instance of the class
+        :param keys: str: Cache keys
+        :return: None
+        """
+        if self._redis is None or not keys:
+            return
+        try:
+            await self._redis.delete(*keys)
+        except redis.RedisError:
+            logger.warning("Cache delete failed for %s", keys, exc_info=True)
+
+    async def incr(self, key: str) -> Optional[int]:
+        """
+        The incr function atomically increments the integer stored under the key.
+
+        :param self: Represent the instance of the class
+        :param key: str: Cache key
+        :return: The new value, or None if Redis is unavailable
+        """
+        if self._redis is None:
+            return None
+        try:
+            return await self._redis.incr(key)
+        except redis.RedisError:
+            logger.warning("Cache incr failed for %s", key, exc_info=True)
+            return None
+
+cache = RedisCache()
+
+
+async def notes_cache_version(user_id: int) -> int:
+    """
+    The notes_cache_version function returns the current version of a user's cached notes.
+    Every cached note list and single note key of the user contains this version,
+    so bumping it invalidates all of them at once without scanning the keyspace.
+
+    :param user_id: int: The owner of the notes
+    :return: The version number, 0 if none was stored yet
+    """
+    value = await cache.get(f"notes_version:{user_id}")
+    return int(value) if value is not None else 0
+
+
+async def forget_cached_notes(user_id: int):
+    """
+    The forget_cached_notes function drops every cached note list and single note of a user
+    by bumping the user's version; the old entries are never read again and expire on their own.
+    It must be called after a change to the user's notes or tags has been committed,
+    because cached notes embed their tags.
+
+    :param user_id: int: The owner of the notes
+    :return: None
+    """
+    await cache.incr(f"notes_version:{user_id}")
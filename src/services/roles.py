@@ -1,9 +1,12 @@
+import logging
 from typing import List
 
 from fastapi import Request, Depends, HTTPException, status
 
 from src.database.models import Role, User
-from src.services.auth import auth_service
+from src.services.auth import get_current_user
+
+logger = logging.getLogger(__name__)
 
 
 class RoleAccess:
@@ -17,9 +20,9 @@ class RoleAccess:
         :return: Nothing
         :doc-author: Trelent
         """
-        self.allowed_roles = allowed_roles
+        self.allowed_roles = frozenset(allowed_roles)
 
-    async def __call__(self, request: Request, user: User = Depends(auth_service.get_current_user)):
+    async def __call__(self, request: Request, user: User = Depends(get_current_user)):
         """
         The __call__ function is a decorator that takes in the request and user as parameters.
         It then checks if the user's role is in the list of allowed roles for this endpoint.
@@ -31,7 +34,7 @@ class RoleAccess:
         :return: A response object, which is a json-serializable object
         :doc-author: Trelent
         """
-        print(user.role)
-        print(self.allowed_roles)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("role=%s allowed=%s", user.role, self.allowed_roles)
         if user.role not in self.allowed_roles:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Operation forbidden")
\ No newline at end of file
@@ -1,7 +1,10 @@
+import asyncio
+import contextlib
 import unittest
 from unittest.mock import MagicMock
 
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Note, Tag, User
 from src.schemas import NoteModel, NoteUpdate, NoteStatusUpdate
@@ -12,82 +15,154 @@ from src.repository.notes import (
     remove_note,
     update_note,
     update_status_note,
+    NotesReadBatcher,
 )
 
 
 class TestNotes(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
-        self.session = MagicMock(spec=Session)
+        self.session = MagicMock(spec=AsyncSession)
         self.user = User(id=1)
+        self.result = MagicMock()
+        self.session.execute.return_value = self.result
 
     async def test_get_notes(self):
         notes = [Note(), Note(), Note()]
-        self.session.query().filter().offset().limit().all.return_value = notes
+        self.result.scalars().all.return_value = notes
         result = await get_notes(skip=0, limit=10, user=self.user, db=self.session)
         self.assertEqual(result, notes)
+        stmt = self.session.execute.call_args.args[0]
+        self.assertTrue(stmt._with_options)
+
+    async def test_get_notes_batched(self):
+        first, second = Note(user_id=1), Note(user_id=2)
+        self.result.scalars().all.return_value = [first, second]
+
+        @contextlib.asynccontextmanager
+        async def session_factory():
+            yield self.session
+
+        batcher = NotesReadBatcher()
+        batcher.start(session_factory)
+        try:
+            result = await asyncio.gather(batcher.get(1, 0, 10), batcher.get(2, 0, 10), batcher.get(3, 0, 10))
+        finally:
+            await batcher.stop()
+        self.assertEqual(result, [[first], [second], []])
+        self.session.execute.assert_awaited_once()
+        stmt = self.session.execute.call_args.args[0]
+        self.assertIn("JOIN LATERAL", str(stmt.compile(dialect=postgresql.dialect())))
+
+    async def test_get_notes_batcher_single_read(self):
+        note = Note(user_id=1)
+        self.result.scalars().all.return_value = [note]
+
+        @contextlib.asynccontextmanager
+        async def session_factory():
+            yield self.session
+
+        batcher = NotesReadBatcher()
+        batcher.start(session_factory)
+        try:
+            result = await batcher.get(1, 0, 10)
+        finally:
+            await batcher.stop()
+        self.assertEqual(result, [note])
+        stmt = self.session.execute.call_args.args[0]
+        self.assertNotIn("LATERAL", str(stmt.compile(dialect=postgresql.dialect())))
+
+    async def test_get_notes_batches_run_concurrently(self):
+        note = Note(user_id=1)
+        self.result.scalars().all.return_value = [note]
+        release = asyncio.Event()
+
+        async def execute(stmt):
+            if self.session.execute.await_count == 1:
+                await release.wait()
+            return self.result
+        self.session.execute.side_effect = execute
+
+        @contextlib.asynccontextmanager
+        async def session_factory():
+            yield self.session
+
+        batcher = NotesReadBatcher()
+        batcher.start(session_factory)
+        try:
+            slow = asyncio.create_task(batcher.get(1, 0, 10))
+            await asyncio.sleep(0.05)
+            fast = await asyncio.wait_for(batcher.get(1, 10, 10), timeout=1)
+            release.set()
+            self.assertEqual(await slow, [note])
+        finally:
+            await batcher.stop()
+        self.assertEqual(fast, [note])
 
     async def test_get_note_found(self):
         note = Note()
-        self.session.query().filter().first.return_value = note
+        self.result.scalar_one_or_none.return_value = note
         result = await get_note(note_id=1, user=self.user, db=self.session)
         self.assertEqual(result, note)
 
     async def test_get_note_not_found(self):
-        self.session.query().filter().first.return_value = None
+        self.result.scalar_one_or_none.return_value = None
         result = await get_note(note_id=1, user=self.user, db=self.session)
         self.assertIsNone(result)
 
     async def test_create_note(self):
         body = NoteModel(title="test", description="test note", tags=[1, 2])
         tags = [Tag(id=1, user_id=1), Tag(id=2, user_id=1)]
-        self.session.query().filter().all.return_value = tags
+        self.result.scalars().all.return_value = tags
         result = await create_note(body=body, user=self.user, db=self.session)
         self.assertEqual(result.title, body.title)
         self.assertEqual(result.description, body.description)
         self.assertEqual(result.tags, tags)
         self.assertTrue(hasattr(result, "id"))
+        self.session.add.assert_called_once_with(result)
+        self.session.commit.assert_awaited_once()
 
     async def test_remove_note_found(self):
         note = Note()
-        self.session.query().filter().first.return_value = note
+        self.result.scalar_one_or_none.return_value = note
         result = await remove_note(note_id=1, user=self.user, db=self.session)
         self.assertEqual(result, note)
+        self.session.delete.assert_awaited_once_with(note)
 
     async def test_remove_note_not_found(self):
-        self.session.query().filter().first.return_value = None
+        self.result.scalar_one_or_none.return_value = None
         result = await remove_note(note_id=1, user=self.user, db=self.session)
         self.assertIsNone(result)
+        self.session.delete.assert_not_awaited()
 
     async def test_update_note_found(self):
         body = NoteUpdate(title="test", description="test note", tags=[1, 2], done=True)
         tags = [Tag(id=1, user_id=1), Tag(id=2, user_id=1)]
         note = Note(tags=tags)
-        self.session.query().filter().first.return_value = note
-        self.session.query().filter().all.return_value = tags
-        self.session.commit.return_value = None
+        self.result.scalar_one_or_none.return_value = note
+        self.result.scalars().all.return_value = tags
         result = await update_note(note_id=1, body=body, user=self.user, db=self.session)
         self.assertEqual(result, note)
+        self.assertEqual(result.title, body.title)
+        self.assertEqual(result.tags, tags)
 
     async def test_update_note_not_found(self):
         body = NoteUpdate(title="test", description="test note", tags=[1, 2], done=True)
-        self.session.query().filter().first.return_value = None
-        self.session.commit.return_value = None
+        self.result.scalar_one_or_none.return_value = None
         result = await update_note(note_id=1, body=body, user=self.user, db=self.session)
         self.assertIsNone(result)
 
     async def test_update_status_note_found(self):
         body = NoteStatusUpdate(done=True)
         note = Note()
-        self.session.query().filter().first.return_value = note
-        self.session.commit.return_value = None
+        self.result.scalar_one_or_none.return_value = note
         result = await update_status_note(note_id=1, body=body, user=self.user, db=self.session)
         self.assertEqual(result, note)
+        self.assertTrue(result.done)
 
     async def test_update_status_note_not_found(self):
         body = NoteStatusUpdate(done=True)
-        self.session.query().filter().first.return_value = None
-        self.session.commit.return_value = None
+        self.result.scalar_one_or_none.return_value = None
         result = await update_status_note(note_id=1, body=body, user=self.user, db=self.session)
         self.assertIsNone(result)
 
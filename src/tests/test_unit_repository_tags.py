@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import MagicMock
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.models import Note, Tag, User
 from src.schemas import NoteModel, NoteUpdate, NoteStatusUpdate, TagModel
 
@@ -15,73 +15,68 @@ from src.repository.tags import (
 class TestTags(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
-        self.session = MagicMock(spec=Session)
+        self.session = MagicMock(spec=AsyncSession)
         self.user = User(id=1)
+        self.result = MagicMock()
+        self.session.execute.return_value = self.result
 
 
         
     async def test_get_tags(self):
         tags = [Tag(), Tag(), Tag()]
-        self.session.query().filter().offset().limit().all.return_value = tags
+        self.result.scalars().all.return_value = tags
         result = await get_tags(skip=0, limit=10, user=self.user, db=self.session)
         self.assertEqual(result, tags)
 
     async def test_get_tag_found(self):
         tag = Tag()
-        self.session.query().filter().first.return_value = tag
+        self.result.scalar_one_or_none.return_value = tag
         result = await get_tag(tag_id=1, user=self.user, db=self.session)
         self.assertEqual(result, tag)
 
     async def test_get_tag_not_found(self):
-        self.session.query().filter().first.return_value = None
+        self.result.scalar_one_or_none.return_value = None
         result = await get_tag(tag_id=1, user=self.user, db=self.session)
         self.assertIsNone(result)
 
     async def test_create_tag(self):
         body = TagModel(name="test")
-        tag = Tag(id=1, user_id=1, name=body.name)
-        self.session.add.return_value = None
-        self.session.commit.return_value = None
-        self.session.refresh.return_value = None
         result = await create_tag(body=body, user=self.user, db=self.session)
-        self.assertEqual(result, tag)
         self.assertEqual(result.name, body.name)
         self.assertEqual(result.user_id, self.user.id)
+        self.session.add.assert_called_once_with(result)
+        self.session.flush.assert_awaited_once()
+        self.session.refresh.assert_awaited_once_with(result)
+        self.session.commit.assert_awaited_once()
 
     async def test_update_tag_found(self):
         body = TagModel(name="updated")
-        tag = Tag(id=1, user_id=1)
-        self.session.query().filter().first.return_value = tag
-        self.session.commit.return_value = None
+        tag = Tag(id=1, user_id=1, name=body.name)
+        self.result.scalar_one_or_none.return_value = tag
         result = await update_tag(tag_id=1, body=body, user=self.user, db=self.session)
         self.assertEqual(result, tag)
         self.assertEqual(result.name, body.name)
+        self.session.execute.assert_awaited_once()
+        self.session.commit.assert_awaited_once()
 
     async def test_update_tag_not_found(self):
         body = TagModel(name="updated")
-        self.session.query().filter().first.return_value = None
-        self.session.commit.return_value = None
+        self.result.scalar_one_or_none.return_value = None
         result = await update_tag(tag_id=1, body=body, user=self.user, db=self.session)
         self.assertIsNone(result)
 
     async def test_remove_tag_found(self):
         tag = Tag(id=1, user_id=1)
-        self.session.query().filter().first.return_value = tag
-        self.session.commit.return_value = None
+        self.result.scalar_one_or_none.return_value = tag
         result = await remove_tag(tag_id=1, user=self.user, db=self.session)
         self.assertEqual(result, tag)
+        self.session.execute.assert_awaited_once()
+        self.session.commit.assert_awaited_once()
 
     async def test_remove_tag_not_found(self):
-        self.session.query().filter().first.return_value = None
-        self.session.commit.return_value = None
+        self.result.scalar_one_or_none.return_value = None
         result = await remove_tag(tag_id=1, user=self.user, db=self.session)
         self.assertIsNone(result)
 
 if __name__ == '__main__':
     unittest.main()
-
-
-
-
-
-       
\ No newline at end of file
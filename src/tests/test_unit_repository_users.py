@@ -1,10 +1,16 @@
 import unittest
-from unittest.mock import MagicMock
-from sqlalchemy.orm import Session
+from unittest.mock import AsyncMock, MagicMock, patch
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.models import Note, Tag, User
 from src.schemas import NoteModel, NoteUpdate, NoteStatusUpdate, TagModel, UserModel
 from src.repository.users import (
     get_user_by_email,
+    get_cached_user_by_email,
+    email_exists,
+    get_user_by_refresh_token,
+    revoke_refresh_token,
+    forget_cached_user,
     create_user,
     update_token,
     confirmed_email,
@@ -15,39 +21,79 @@ from libgravatar import Gravatar
 class TestUsers(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
-        self.session = MagicMock(spec=Session)
+        self.session = MagicMock(spec=AsyncSession)
         self.user = User(id=1)
+        self.result = MagicMock()
+        self.session.execute.return_value = self.result
 
 
 
     async def test_get_user_by_email(self):
         user = User()
-        self.session.query().filter().first.return_value = user
+        self.result.scalar_one_or_none.return_value = user
         result = await get_user_by_email(email="test@example.com", db=self.session)
         self.assertEqual(result, user)
 
+    async def test_email_exists(self):
+        self.result.scalar.return_value = True
+        result = await email_exists(email="test@example.com", db=self.session)
+        self.assertTrue(result)
+
+    async def test_get_user_by_refresh_token(self):
+        user = User()
+        self.result.scalar_one_or_none.return_value = user
+        result = await get_user_by_refresh_token(email="test@example.com", token="token", db=self.session)
+        self.assertEqual(result, user)
+
+    async def test_revoke_refresh_token(self):
+        await revoke_refresh_token(email="test@example.com", db=self.session)
+        self.session.execute.assert_awaited_once()
+        self.session.commit.assert_awaited_once()
+
+    async def test_get_cached_user_by_email(self):
+        user = User(id=1, email="cached@example.com", password="hash", refresh_token="token")
+        self.result.scalar_one_or_none.return_value = user
+        with patch("src.repository.users.cache") as cache:
+            cache.get = AsyncMock(return_value=None)
+            cache.set = AsyncMock()
+            result = await get_cached_user_by_email(email="cached@example.com", db=self.session)
+            self.assertEqual(result, user)
+            snapshot = cache.set.await_args.args[1]
+            cache.get = AsyncMock(return_value=snapshot)
+            result = await get_cached_user_by_email(email="cached@example.com", db=self.session)
+        self.assertNotIn("password", orjson.loads(snapshot))
+        self.assertNotIn("refresh_token", orjson.loads(snapshot))
+        self.assertIsNot(result, user)
+        self.assertEqual((result.id, result.email), (1, "cached@example.com"))
+        self.session.execute.assert_awaited_once()
+
+    async def test_forget_cached_user(self):
+        with patch("src.repository.users.cache") as cache:
+            cache.delete = AsyncMock()
+            await forget_cached_user("cached@example.com")
+        cache.delete.assert_awaited_once_with("user:cached@example.com")
+
     async def test_create_user(self):
-        body = UserModel(email="test@example.com")
-        new_user = User(**body.model_dump(), avatar=None)
-        self.session.add.return_value = None
-        self.session.commit.return_value = None
-        self.session.refresh.return_value = None
+        body = UserModel(username="tester", email="test@example.com", password="secret")
         result = await create_user(body=body, db=self.session)
-        self.assertEqual(result, new_user)
         self.assertEqual(result.email, body.email)
+        self.assertEqual(result.username, body.username)
+        self.session.add.assert_called_once_with(result)
+        self.session.commit.assert_awaited_once()
 
     async def test_update_token(self):
         user = User()
         token = "new_token"
-        self.session.commit.return_value = None
         await update_token(user=user, token=token, db=self.session)
-        self.assertEqual(user.refresh_token, token)
+        self.session.execute.assert_awaited_once()
+        self.session.merge.assert_not_called()
+        self.session.commit.assert_awaited_once()
 
     async def test_confirmed_email(self):
         user = User()
-        self.session.commit.return_value = None
+        self.result.scalar_one_or_none.return_value = user
         await confirmed_email(email="test@example.com", db=self.session)
         self.assertTrue(user.confirmed)
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()